@@ -1,12 +1,13 @@
+import functools
 import os
 import re
-import pyperclip
-from datetime import datetime
+import time
 from dotenv import load_dotenv
 
 # === SETTINGS ===
 DEBUG = True
 DEFAULT_FORMAT = "txt"  # "txt" or "docx" (you can still pick at runtime)
+EXTRACTION_WINDOW = 4096  # only the first N characters are searched for title/company
 
 # === LOAD ENVIRONMENT VARIABLES ===
 load_dotenv()
@@ -17,11 +18,28 @@ if not SAVE_FOLDER:
 os.makedirs(SAVE_FOLDER, exist_ok=True)
 
 # === GET CLIPBOARD CONTENT ===
-job_description = pyperclip.paste()
+def get_clipboard():
+    import pyperclip  # lazy import (loads a platform clipboard backend)
+    return pyperclip.paste()
+
+job_description = get_clipboard()
 if not job_description.strip():
     print("Clipboard is empty. Copy a job description first.")
     raise SystemExit(1)
 
+# Title and company show up near the top; the full text is only needed when saving
+extraction_text = job_description[:EXTRACTION_WINDOW]
+if len(job_description) > EXTRACTION_WINDOW and job_description[EXTRACTION_WINDOW] not in "\r\n":
+    # The window ends mid-line; a cut-off label value ("Company: Ac") must
+    # never be read as a complete one. Drop the partial line, or, if the
+    # window is all one line, extend it to the end of that line instead.
+    last_newline = extraction_text.rfind("\n")
+    if last_newline > 0:
+        extraction_text = extraction_text[:last_newline]
+    else:
+        line_end = job_description.find("\n", EXTRACTION_WINDOW)
+        extraction_text = job_description if line_end == -1 else job_description[:line_end]
+
 # === CONSTANTS ===
 ROLE_KEYWORDS = [
     "Engineer","Developer","Manager","Analyst","Designer","Scientist","Architect",
@@ -31,16 +49,63 @@ ROLE_KEYWORDS = [
     "Security","Cloud","DevOps","SRE","Product","Project","Program","QA","Quality",
     "Support","Sales","Marketing","Finance","HR","People","Operations","IT","UX","UI"
 ]
-PREFERRED_TITLES = {
+PREFERRED_TITLES = frozenset({
     "software developer","software engineer","data analyst","data scientist",
     "backend developer","frontend developer","full stack developer","full stack engineer",
     "web developer","application developer", "cloud developer"
-}
-BANNED_TITLES = {
+})
+BANNED_TITLES = frozenset({
     "seniority","seniority level","employment","employment type",
     "job","title","position","role","location","locations",
     "department","division","schedule","shift","vacancy"
-}
+})
+# Filler that reads like a role but isn't one ("as a member of the team")
+GENERIC_PHRASES = frozenset({
+    "member of the team", "part of the team", "part of our team",
+    "member of our company", "part of the company", "team member"
+})
+
+# US state abbreviations
+STATE_ABBR = frozenset({
+    "al","ak","az","ar","ca","co","ct","de","fl","ga","hi","id","il","in","ia","ks","ky","la",
+    "me","md","ma","mi","mn","ms","mo","mt","ne","nv","nh","nj","nm","ny","nc","nd","oh","ok",
+    "or","pa","ri","sc","sd","tn","tx","ut","vt","va","wa","wv","wi","wy"
+})
+
+# Common country abbreviations (ISO alpha-2)
+COUNTRY_ABBR = frozenset({
+    "us","uk","ca","au","nz","de","fr","es","it","nl","se","no","fi","ch","jp","cn","in","br","mx"
+})
+
+# Full US state names
+STATE_NAMES = frozenset({
+    "alabama","alaska","arizona","arkansas","california","colorado","connecticut","delaware",
+    "florida","georgia","hawaii","idaho","illinois","indiana","iowa","kansas","kentucky",
+    "louisiana","maine","maryland","massachusetts","michigan","minnesota","mississippi",
+    "missouri","montana","nebraska","nevada","new hampshire","new jersey","new mexico",
+    "new york","north carolina","north dakota","ohio","oklahoma","oregon","pennsylvania",
+    "rhode island","south carolina","south dakota","tennessee","texas","utah","vermont",
+    "virginia","washington","west virginia","wisconsin","wyoming"
+})
+
+# Common country names
+COUNTRY_NAMES = frozenset({
+    "united states","usa","canada","australia","united kingdom","england","scotland","wales",
+    "ireland","germany","france","spain","italy","netherlands","sweden","norway","denmark",
+    "finland","switzerland","japan","china","india","brazil","mexico"
+})
+
+# Any of the above, for single-lookup membership tests
+LOCATION_WORDS = STATE_ABBR | COUNTRY_ABBR | STATE_NAMES | COUNTRY_NAMES
+
+# Connector words that may stay lowercase in a title-cased phrase
+SMALL_WORDS = frozenset({"of","and","for","to","in","on","with","the","a","an","or"})
+# Largest bonus scoring can add on top of a candidate's base score
+TITLE_MAX_BONUS = 3 + 2 + 5  # role keyword + title-cased + preferred role
+COMPANY_MAX_BONUS = 3 + 2    # legal suffix + title-cased
+
+# Lowercased once here so has_role_keyword doesn't redo it for every keyword
+ROLE_KEYWORDS_LC = tuple(kw.lower() for kw in ROLE_KEYWORDS)
 
 EMAIL_OR_URL = re.compile(r"(https?://\S+|\b\w+@\w+\.\w+)", re.IGNORECASE)
 COMMON_FILLER_START = re.compile(r"^(the|a|an|our|we|i)\b", re.IGNORECASE)
@@ -48,27 +113,85 @@ TRAILING_DEPT = re.compile(r"\b(team|department|group|program|studio|lab|labs)\b
 LEADING_COMPANY_LABEL = re.compile(r"^(company|employer|organization|org)\s*[:\-–]\s*", re.IGNORECASE)
 NON_NAME_VERBS = re.compile(r"\b(is|are|seeking|hiring|looking|need|needs|join|build|help|drive|lead)\b", re.IGNORECASE)
 
-def debug(msg):
+# General text helpers
+HAS_LETTER = re.compile(r"[A-Za-z]")
+SENTENCE_BREAK = re.compile(r"[.|;]\s")
+UNSAFE_FILENAME_CHARS = re.compile(r"[^\w \-]")  # keeps letters, digits, space, "-" and "_"
+
+# Line shapes used to pull company/title out of a single line
+COMPANY_IS_LINE = re.compile(r"^([A-Z][\w& ]+?)\s+is\s+.+$")
+HIRING_LINE = re.compile(r"^([A-Z][\w& ]+?)\s+is\s+hiring\s+(?:an?\s+|for\s+an?\s+)?(.+)$", re.IGNORECASE)
+SEEKING_LINE = re.compile(r"^([A-Z][\w& ]+?)\s+is\s+seeking\s+(?:an?\s+)?(.+)$", re.IGNORECASE)
+IS_A_LINE = re.compile(r"^([A-Z][\w& ]+?)\s+is\s+a\s+.+$", re.IGNORECASE)
+JOIN_AS_LINE = re.compile(r"^Join\s+([A-Z][\w& ]+?)\s+as\s+(.+)$", re.IGNORECASE)
+
+# Title cleanup
+# Every stop phrase runs to the end of the title, so one alternation removes
+# the earliest of them in a single pass; any leftover "in ..." tail is caught
+# by TRAILING_PREPOSITION right after.
+STOP_PHRASES = re.compile("|".join(f"(?:{p})" for p in [
+    r"\s+who\s+is\s+.*", r"\s+that\s+is\s+.*", r"\s+with\s+experience\s+.*",
+    r"\s+to\s+join\s+our\s+team.*", r"\s+to\s+help\s+.*", r"\s+as\s+part\s+of\s+.*",
+    r"\s+needed\s+.*", r"\s+ASAP.*", r"\s+immediately.*", r"\s+based\s+in\s+.*",
+    r"\s+in\s+[^/\\,:;–—-]+$",
+    r"\s+to\s+work\s+onsite.*",
+    r"\s+to\s+support\s+.*",
+    r"\s+to\s+build\s+.*",
+    r"\s+to\s+develop\s+.*",
+    r"\s+to\s+design\s+.*"
+]), re.IGNORECASE)
+TRAILING_PREPOSITION = re.compile(r"\s+(at|with|for|in)\s+.+$", re.IGNORECASE)
+TRAILING_CITY_STATE = re.compile(r",\s*[A-Za-z\s]+,\s*[A-Z]{2}$")
+TRAILING_CITY_COUNTRY = re.compile(r",\s*[A-Za-z\s]+,\s*[A-Za-z]+$")
+TRAILING_TO_JOIN = re.compile(r"\s+to\s+join.*$", re.IGNORECASE)
+TITLE_DESCRIPTION_TAIL = re.compile(r"\s*[-–—:]\s+[a-z].*")
+LEADING_TITLE_LABEL = re.compile(r"^(Hiring|Role|Position|Title)\s*[:\-–]\s*", re.IGNORECASE)
+
+# Company cleanup
+TRADEMARK_SYMBOLS = str.maketrans("", "", "®™©")
+LINKEDIN_ARTIFACTS = re.compile(r"\b(?:logo|see jobs?|view profile)\b", re.IGNORECASE)
+COMPANY_DESCRIPTION_TAIL = re.compile(r"\s*[-–—:|]\s+[a-z].*")
+COMPANY_DIVIDERS = re.compile(r"[|,/]")
+LEGAL_SUFFIX = re.compile(r"\b(Inc|LLC|Ltd|Limited|Corporation|Corp|GmbH|PLC|Pte|BV|S\.A\.|SAS)\b\.?")
+TRAILING_CITY = re.compile(r",\s*[A-Z][a-z]+$")
+
+# Candidate extraction over the top of the description (extraction_text)
+TITLE_LABEL = re.compile(r"(?:Job\s*Title|Position|Role|Title)\s*[:\-–]\s*([^\n]+)", re.IGNORECASE)
+LOOKING_FOR = re.compile(r"looking\s+for\s+a[n]?\s+([^\n]+)", re.IGNORECASE)
+AS_A = re.compile(r"\bas\s+a[n]?\s+([^\n,]+)", re.IGNORECASE)
+TITLE_AT_SYMBOL_COMPANY = re.compile(r"^([A-Z][A-Za-z0-9/&\-\s]+?)\s*@\s*[A-Z][^\n]+", re.MULTILINE)
+TITLE_AT_COMPANY = re.compile(r"^([A-Z][A-Za-z0-9/&\-\s]+?)\s+at\s+[A-Z][^\n]+", re.MULTILINE | re.IGNORECASE)
+COMPANY_LABEL = re.compile(r"(?:Company|Employer|Organization|Hiring\s*Organization)\s*[:\-–]\s*([^\n]+)", re.IGNORECASE)
+AT_SYMBOL_COMPANY = re.compile(r"@\s*([A-Z][A-Za-z0-9&.,' ]+)")
+AT_COMPANY = re.compile(r"\bat\s+(?!the\b|scale\b|least\b|most\b)([A-Z][A-Za-z0-9&.,' ]+)", re.IGNORECASE)
+CAREERS_OR_JOIN = re.compile(r"(?:careers\s+at|join)\s+([A-Z][A-Za-z0-9&.,' ]+)", re.IGNORECASE)
+
+def debug(msg, *args):
+    # Arguments are %-formatted only when DEBUG is on, so call sites cost
+    # nothing beyond the call itself in normal runs.
     if DEBUG:
-        print(f"[DEBUG] {msg}")
+        print("[DEBUG] " + (msg % args if args else msg))
 
 def sanitize_filename(name):
-    return "".join(c for c in name if c.isalnum() or c in (" ", "-", "_")).rstrip()
+    return UNSAFE_FILENAME_CHARS.sub("", name).rstrip()
 
 def looks_title_cased(text):
-    small = {"of","and","for","to","in","on","with","the","a","an","or"}
-    words = [w for w in re.split(r"\s+", text.strip()) if w]
+    words = text.split()
     if not words:
         return False
+    needed = max(1, int(0.6 * len(words)))
     caps = 0
     for i, w in enumerate(words):
-        if re.match(r"^[A-Za-z]+$", w):
-            if w[0].isupper() or (i > 0 and w.lower() in small):
+        if w.isascii() and w.isalpha():
+            if w[0].isupper() or (i > 0 and w.lower() in SMALL_WORDS):
                 caps += 1
         else:
             caps += 1
-    return caps >= max(1, int(0.6 * len(words)))
+        if caps >= needed:
+            return True
+    return False
 
+@functools.lru_cache(maxsize=256)
 def is_probable_location(text):
     """
     Returns True if the given text looks like a location (city, state, country).
@@ -78,47 +201,17 @@ def is_probable_location(text):
     text = text.strip()
     text_lower = text.lower()
 
-    # US state abbreviations
-    state_abbr = {
-        "al","ak","az","ar","ca","co","ct","de","fl","ga","hi","id","il","in","ia","ks","ky","la",
-        "me","md","ma","mi","mn","ms","mo","mt","ne","nv","nh","nj","nm","ny","nc","nd","oh","ok",
-        "or","pa","ri","sc","sd","tn","tx","ut","vt","va","wa","wv","wi","wy"
-    }
-
-    # Common country abbreviations (ISO alpha-2)
-    country_abbr = {
-        "us","uk","ca","au","nz","de","fr","es","it","nl","se","no","fi","ch","jp","cn","in","br","mx"
-    }
-
-    # Full US state names
-    state_names = {
-        "alabama","alaska","arizona","arkansas","california","colorado","connecticut","delaware",
-        "florida","georgia","hawaii","idaho","illinois","indiana","iowa","kansas","kentucky",
-        "louisiana","maine","maryland","massachusetts","michigan","minnesota","mississippi",
-        "missouri","montana","nebraska","nevada","new hampshire","new jersey","new mexico",
-        "new york","north carolina","north dakota","ohio","oklahoma","oregon","pennsylvania",
-        "rhode island","south carolina","south dakota","tennessee","texas","utah","vermont",
-        "virginia","washington","west virginia","wisconsin","wyoming"
-    }
-
-    # Common country names
-    country_names = {
-        "united states","usa","canada","australia","united kingdom","england","scotland","wales",
-        "ireland","germany","france","spain","italy","netherlands","sweden","norway","denmark",
-        "finland","switzerland","japan","china","india","brazil","mexico"
-    }
-
     # --- Strong comma rule ---
     if "," in text:
-        parts = [p.strip().lower() for p in text.split(",", 1)]
+        parts = [p.strip() for p in text_lower.split(",", 1)]
         if len(parts) == 2:
             second = parts[1]
-            if second in state_abbr or second in country_abbr or second in state_names or second in country_names:
+            if second in LOCATION_WORDS:
                 return True
 
     # --- All-words rule ---
     words = [w.strip(",.") for w in text_lower.split()]
-    if all(w in state_abbr or w in country_abbr or w in state_names or w in country_names for w in words):
+    if all(w in LOCATION_WORDS for w in words):
         return True
 
     return False
@@ -129,29 +222,29 @@ def find_company_in_next_lines(lines, start_index, max_ahead=5):
         if not ln:
             continue
         # Match "Company is ..." or "About Company"
-        m = re.match(r"^([A-Z][\w& ]+?)\s+is\s+.+$", ln)
+        m = COMPANY_IS_LINE.match(ln)
         if m and not is_probable_location(m.group(1)):
             return m.group(1).strip()
     return None
 
 def extract_company_and_title_from_line(line):
     # 1. Company is hiring a Job Title
-    m = re.match(r"^([A-Z][\w& ]+?)\s+is\s+hiring\s+(?:an?\s+|for\s+an?\s+)?(.+)$", line, flags=re.IGNORECASE)
+    m = HIRING_LINE.match(line)
     if m:
         return m.group(1).strip(), m.group(2).strip(), False
 
     # 2. Company is seeking a Job Title
-    m = re.match(r"^([A-Z][\w& ]+?)\s+is\s+seeking\s+(?:an?\s+)?(.+)$", line, flags=re.IGNORECASE)
+    m = SEEKING_LINE.match(line)
     if m:
         return m.group(1).strip(), m.group(2).strip(), False
 
     # 3. Company is a ... (no title)
-    m = re.match(r"^([A-Z][\w& ]+?)\s+is\s+a\s+.+$", line, flags=re.IGNORECASE)
+    m = IS_A_LINE.match(line)
     if m:
         return m.group(1).strip(), None, False
 
     # 4. Join Company as Job Title
-    m = re.match(r"^Join\s+([A-Z][\w& ]+?)\s+as\s+(.+)$", line, flags=re.IGNORECASE)
+    m = JOIN_AS_LINE.match(line)
     if m:
         company = m.group(1).strip()
         title = m.group(2).strip()
@@ -161,46 +254,31 @@ def extract_company_and_title_from_line(line):
 
     return None, None, False
 
+@functools.lru_cache(maxsize=256)
 def clean_title(title):
     # --- Remove known stop phrases ---
-    stop_phrases = [
-        r"\s+who\s+is\s+.*", r"\s+that\s+is\s+.*", r"\s+with\s+experience\s+.*",
-        r"\s+to\s+join\s+our\s+team.*", r"\s+to\s+help\s+.*", r"\s+as\s+part\s+of\s+.*",
-        r"\s+needed\s+.*", r"\s+ASAP.*", r"\s+immediately.*", r"\s+based\s+in\s+.*",
-        r"\s+in\s+[^/\\,:;–—-]+$",
-        r"\s+to\s+work\s+onsite.*",
-        r"\s+to\s+support\s+.*",
-        r"\s+to\s+build\s+.*",
-        r"\s+to\s+develop\s+.*",
-        r"\s+to\s+design\s+.*"
-    ]
-    for pat in stop_phrases:
-        title = re.sub(pat, "", title, flags=re.IGNORECASE)
+    title = STOP_PHRASES.sub("", title)
 
     # --- Remove trailing location/company fragments ---
-    title = re.sub(r"\s+(at|with|for|in)\s+.+$", "", title, flags=re.IGNORECASE)
-    title = re.sub(r",\s*[A-Za-z\s]+,\s*[A-Z]{2}$", "", title)       # , City, ST
-    title = re.sub(r",\s*[A-Za-z\s]+,\s*[A-Za-z]+$", "", title)      # , City, Country
+    title = TRAILING_PREPOSITION.sub("", title)
+    title = TRAILING_CITY_STATE.sub("", title)      # , City, ST
+    title = TRAILING_CITY_COUNTRY.sub("", title)    # , City, Country
 
     # --- Remove trailing filler like "to join our team" ---
-    title = re.sub(r"\s+to\s+join.*$", "", title, flags=re.IGNORECASE)
+    title = TRAILING_TO_JOIN.sub("", title)
 
     # --- Filter out generic non-title phrases ---
-    generic_phrases = {
-        "member of the team", "part of the team", "part of our team",
-        "member of our company", "part of the company", "team member"
-    }
-    if title.strip().lower() in generic_phrases:
+    if title.strip().lower() in GENERIC_PHRASES:
         return ""
 
     # --- Cut if punctuation followed by lowercase descriptive text ---
-    title = re.sub(r"\s*[-–—:]\s+[a-z].*", "", title)
+    title = TITLE_DESCRIPTION_TAIL.sub("", title)
 
     # --- Remove leading labels ---
-    title = re.sub(r"^(Hiring|Role|Position|Title)\s*[:\-–]\s*", "", title, flags=re.IGNORECASE)
+    title = LEADING_TITLE_LABEL.sub("", title)
 
     # --- Cut at sentence punctuation if long ---
-    title = re.split(r"[.|;]\s", title)[0]
+    title = SENTENCE_BREAK.split(title)[0]
 
     # --- Limit words ---
     words = title.split()
@@ -220,37 +298,36 @@ def clean_title(title):
     return title
 
 
+@functools.lru_cache(maxsize=256)
 def clean_company(name):
     name = EMAIL_OR_URL.sub("", name)
-    name = name.replace("®", "").replace("™", "").replace("©", "")
+    name = name.translate(TRADEMARK_SYMBOLS)
     name = LEADING_COMPANY_LABEL.sub("", name).strip()
     # LinkedIn artifacts
-    name = re.sub(r"\blogo\b", "", name, flags=re.IGNORECASE)
-    name = re.sub(r"\bsee jobs?\b", "", name, flags=re.IGNORECASE)
-    name = re.sub(r"\bview profile\b", "", name, flags=re.IGNORECASE)
+    name = LINKEDIN_ARTIFACTS.sub("", name)
     # Cut at separators if description follows
-    name = re.sub(r"\s*[-–—:|]\s+[a-z].*", "", name)
+    name = COMPANY_DESCRIPTION_TAIL.sub("", name)
     # Remove trailing department-like words
     name = TRAILING_DEPT.sub("", name).strip()
     # Normalize
-    name = re.sub(r"\s+", " ", name).strip(" \t-–—:,.")
+    name = " ".join(name.split()).strip(" \t-–—:,.")
     # Keep first chunk before dividers
-    name = re.split(r"[|,/]", name)[0].strip()
+    name = COMPANY_DIVIDERS.split(name)[0].strip()
     return name
 
 def has_role_keyword(text):
     t = text.lower()
-    return any(kw.lower() in t for kw in ROLE_KEYWORDS)
+    return any(kw in t for kw in ROLE_KEYWORDS_LC)
 
 # === TITLE CANDIDATES ===
 title_candidates = []
 
 def add_title_candidate(val, score, why):
-    val = re.sub(r"\s+", " ", val).strip()
+    val = " ".join(val.split())
     if not val:
         return
     title_candidates.append((val, score, why))
-    debug(f"Title candidate (+{score}): '{val}' via {why}")
+    debug("Title candidate (+%s): '%s' via %s", score, val, why)
 
 # === COMPANY CANDIDATES ===
 company_candidates = []
@@ -260,46 +337,42 @@ def add_company_candidate(val, score, why):
     if not cleaned:
         return
     if is_probable_location(cleaned):
-        debug(f"Rejected company candidate '{cleaned}' (looks like location) from {why}")
+        debug("Rejected company candidate '%s' (looks like location) from %s", cleaned, why)
         return
     company_candidates.append((cleaned, score, why))
-    debug(f"Company candidate (+{score}): '{cleaned}' via {why}")
+    debug("Company candidate (+%s): '%s' via %s", score, cleaned, why)
 
 
 # Explicit labels
-m = re.search(r"(?:Job\s*Title|Position|Role|Title)\s*[:\-–]\s*([^\n]+)", job_description, flags=re.IGNORECASE)
+m = TITLE_LABEL.search(extraction_text)
 if m: add_title_candidate(m.group(1), 6, "label")
 
 # Looking for a/an ...
-m = re.search(r"(?i)looking\s+for\s+a[n]?\s+([^\n]+)", job_description)
+m = LOOKING_FOR.search(extraction_text)
 if m: add_title_candidate(m.group(1), 5, "looking for a/an")
 
 # "As a/an ..." pattern ...
-m = re.search(r"(?i)\bas\s+a[n]?\s+([^\n,]+)", job_description)
+m = AS_A.search(extraction_text)
 if m:
     candidate = m.group(1).strip()
 
     # Only keep if it starts with a capital letter and isn't a generic filler phrase
-    generic_phrases = {
-        "member of the team", "part of the team", "part of our team",
-        "member of our company", "part of the company", "team member"
-    }
-    if candidate and candidate[0].isupper() and candidate.lower() not in generic_phrases:
+    if candidate and candidate[0].isupper() and candidate.lower() not in GENERIC_PHRASES:
         add_title_candidate(candidate, 5, "as a/an")
 
 
-# Early lines: separators and title-cased
-lines = job_description.splitlines()
+# Early lines: separators and title-cased. No header pass looks past line 12,
+# so split and strip those once and share them with the company passes below.
+lines = [ln.strip() for ln in extraction_text.splitlines()[:12]]
 
 for idx, ln in enumerate(lines[:5]):
-    ln = ln.strip()
     if not ln:
         continue
 
     # Separator split logic stays the same
-    for sep in [" - ", " – ", " — ", ":", " | "]:
-        if sep in ln:
-            left, right = ln.split(sep, 1)
+    for sep in (" - ", " – ", " — ", ":", " | "):
+        left, found, right = ln.partition(sep)  # one scan instead of `in` + split
+        if found:
             if left and left[0].isupper():
                 add_title_candidate(left, 4, f"before '{sep.strip()}'")
             if right and right[0].isupper():
@@ -328,63 +401,88 @@ for idx, ln in enumerate(lines[:5]):
 
 
 # Title @/at Company
-m = re.search(r"^([A-Z][A-Za-z0-9/&\-\s]+?)\s*@\s*[A-Z][^\n]+", job_description, flags=re.MULTILINE)
+m = TITLE_AT_SYMBOL_COMPANY.search(extraction_text)
 if m: add_title_candidate(m.group(1), 5, "Title @ Company")
-m = re.search(r"^([A-Z][A-Za-z0-9/&\-\s]+?)\s+at\s+[A-Z][^\n]+", job_description, flags=re.MULTILINE|re.IGNORECASE)
+m = TITLE_AT_COMPANY.search(extraction_text)
 if m: add_title_candidate(m.group(1), 4, "Title at Company")
 
+def dedupe_candidates(candidates):
+    """
+    Collapse repeated candidate strings so each one is scored only once.
+    Keeps the highest base score, at the position where that score first
+    appeared, so ties still resolve the same way as scoring the full list.
+    """
+    best = {}
+    for val, base, why in candidates:
+        if val not in best or base > best[val][0]:
+            best.pop(val, None)
+            best[val] = (base, why)
+    return [(val, base, why) for val, (base, why) in best.items()]
+
+def by_base_score(candidates):
+    """
+    Candidate positions ordered from highest to lowest base score, so the
+    pickers can stop once no remaining candidate can beat the current best.
+    """
+    return sorted(range(len(candidates)), key=lambda i: -candidates[i][1])
+
 def pick_best_title():
-    best, best_score = None, -999
-    for val, base, why in title_candidates:
+    candidates = dedupe_candidates(title_candidates)
+    best, best_score, best_pos = None, -999, len(candidates)
+    for pos in by_base_score(candidates):
+        val, base, why = candidates[pos]
+        if base + TITLE_MAX_BONUS < best_score:
+            break
         cleaned = clean_title(val)
-        if cleaned.strip().lower() in BANNED_TITLES:
-            debug(f"Rejecting title '{cleaned}' (banned)")
+        cleaned_lower = cleaned.lower()
+        if cleaned_lower in BANNED_TITLES:
+            debug("Rejecting title '%s' (banned)", cleaned)
             continue
         score = base
         if has_role_keyword(val): score += 3
         if looks_title_cased(val): score += 2
         if COMMON_FILLER_START.match(val): score -= 4
-        if len(val.split()) > 10: score -= 3
+        if val.count(" ") >= 10: score -= 3  # more than 10 words (val is single-spaced)
         if not val[0].isupper(): score -= 2
-        if any(pref in cleaned.lower() for pref in PREFERRED_TITLES):
+        if any(pref in cleaned_lower for pref in PREFERRED_TITLES):
             score += 5
-            debug(f"Boosting '{cleaned}' for matching preferred role")
+            debug("Boosting '%s' for matching preferred role", cleaned)
         # Penalize if cleaning removed too much (likely junky phrase)
         if len(cleaned) <= max(3, len(val) * 0.5): score -= 1
-        debug(f"Title score {score} for '{cleaned}' (from '{val}' via {why})")
-        if score > best_score:
-            best_score, best = score, cleaned
+        debug("Title score %s for '%s' (from '%s' via %s)", score, cleaned, val, why)
+        # Ties go to the earlier candidate, as when scanning in order
+        if score > best_score or (score == best_score and pos < best_pos):
+            best_score, best, best_pos = score, cleaned, pos
     return best
 
 best_title = pick_best_title()
 
 # Explicit labels
-m = re.search(r"(?:Company|Employer|Organization|Hiring\s*Organization)\s*[:\-–]\s*([^\n]+)", job_description, flags=re.IGNORECASE)
+m = COMPANY_LABEL.search(extraction_text)
 if m: add_company_candidate(m.group(1), 7, "label")
 
 # @ Company
-for m in re.finditer(r"@\s*([A-Z][A-Za-z0-9&.,' ]+)", job_description):
+for m in AT_SYMBOL_COMPANY.finditer(extraction_text):
     add_company_candidate(m.group(1), 6, "@ Company")
 
 # at Company (avoid common non-company phrases)
-for m in re.finditer(r"\bat\s+(?!the\b|scale\b|least\b|most\b)([A-Z][A-Za-z0-9&.,' ]+)", job_description, flags=re.IGNORECASE):
+for m in AT_COMPANY.finditer(extraction_text):
     add_company_candidate(m.group(1), 5, "at Company")
 
-# Careers at / Join
-for ln in job_description.splitlines()[:12]:
-    ln = ln.strip()
+# Careers at / Join, plus proper-noun-like early lines without verbs and
+# without role keywords. One pass over the header; proper-noun lines are
+# added after every careers/join hit so candidate order is unchanged.
+proper_noun_lines = []
+for idx, ln in enumerate(lines):
     if not ln:
         continue
-    m = re.search(r"(?i)(?:careers\s+at|join)\s+([A-Z][A-Za-z0-9&.,' ]+)", ln)
+    m = CAREERS_OR_JOIN.search(ln)
     if m: add_company_candidate(m.group(1), 4, "careers/join line")
+    if idx < 8 and not NON_NAME_VERBS.search(ln) and looks_title_cased(ln) and not has_role_keyword(ln) and not is_probable_location(ln):
+        proper_noun_lines.append(ln)
 
-# Proper-noun-like early lines without verbs and without role keywords
-for ln in job_description.splitlines()[:8]:
-    ln = ln.strip()
-    if not ln:
-        continue
-    if not NON_NAME_VERBS.search(ln) and looks_title_cased(ln) and not has_role_keyword(ln) and not is_probable_location(ln):
-        add_company_candidate(ln, 3, "proper-noun line")
+for ln in proper_noun_lines:
+    add_company_candidate(ln, 3, "proper-noun line")
 
 def is_probable_company(name):
     if not name or len(name) < 2:
@@ -402,13 +500,13 @@ def is_probable_company(name):
         return False
     if not any(w and w[0].isupper() for w in words):
         return False
-    if not re.search(r"[A-Za-z]", name):
+    if not HAS_LETTER.search(name):
         return False
     return True
 
 def company_score(name):
     score = 0
-    if re.search(r"\b(Inc|LLC|Ltd|Limited|Corporation|Corp|GmbH|PLC|Pte|BV|S\.A\.|SAS)\b\.?", name):
+    if LEGAL_SUFFIX.search(name):
         score += 3
     if looks_title_cased(name):
         score += 2
@@ -421,21 +519,25 @@ def company_score(name):
     return score
 
 def pick_best_company():
-    best, best_score = None, -999
-    for val, base, why in company_candidates:
+    candidates = dedupe_candidates(company_candidates)
+    best, best_score, best_pos = None, -999, len(candidates)
+    for pos in by_base_score(candidates):
+        val, base, why = candidates[pos]
+        if base + COMPANY_MAX_BONUS < best_score:
+            break
         if not is_probable_company(val):
-            debug(f"Reject company '{val}' (fails plausibility) from {why}")
+            debug("Reject company '%s' (fails plausibility) from %s", val, why)
             continue
         score = base + company_score(val)
         # Penalize trailing simple location fragment (e.g., ", Austin")
-        if re.search(r",\s*[A-Z][a-z]+$", val):
+        if TRAILING_CITY.search(val):
             score -= 2
         # Prefer shorter clean names
         if len(val) > 40:
             score -= 3
-        debug(f"Company score {score} for '{val}' via {why}")
-        if score > best_score:
-            best_score, best = score, val
+        debug("Company score %s for '%s' via %s", score, val, why)
+        if score > best_score or (score == best_score and pos < best_pos):
+            best_score, best, best_pos = score, val, pos
     return best
 
 best_company = pick_best_company()
@@ -462,15 +564,21 @@ if fmt not in {"txt", "docx"}:
     fmt = "txt"
 
 # === SAVE FILE ===
-timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M")
+timestamp = time.strftime("%Y-%m-%d_%H-%M")
 file_name_base = f"{sanitize_filename(best_company)} - {sanitize_filename(best_title)} - {timestamp}"
-file_path = os.path.join(SAVE_FOLDER, f"{file_name_base}.{fmt}")
+txt_path = os.path.join(SAVE_FOLDER, f"{file_name_base}.txt")
+docx_path = os.path.join(SAVE_FOLDER, f"{file_name_base}.docx")
+file_path = docx_path if fmt == "docx" else txt_path
+
+def save_txt(path):
+    # Encode once and hand the bytes over in a single write. Newlines are
+    # translated the same way text mode would (CRLF on Windows).
+    text = f"{best_title}\nCompany: {best_company}\n\n{job_description}"
+    with open(path, "wb") as f:
+        f.write(text.replace("\n", os.linesep).encode("utf-8"))
 
 if fmt == "txt":
-    with open(file_path, "w", encoding="utf-8") as f:
-        f.write(f"{best_title}\n")
-        f.write(f"Company: {best_company}\n\n")
-        f.write(job_description)
+    save_txt(file_path)
 else:
     try:
         from docx import Document  # lazy import
@@ -482,10 +590,7 @@ else:
         doc.save(file_path)
     except Exception as e:
         print(f"Could not save as .docx ({e}). Saving as .txt instead.")
-        file_path = os.path.join(SAVE_FOLDER, f"{file_name_base}.txt")
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(f"{best_title}\n")
-            f.write(f"Company: {best_company}\n\n")
-            f.write(job_description)
+        file_path = txt_path
+        save_txt(file_path)
 
 print(f"Job description saved to: {file_path}")
\ No newline at end of file